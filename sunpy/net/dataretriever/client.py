@@ -1,5 +1,4 @@
 from pathlib import Path
-from collections import OrderedDict
 
 import astropy.table
 
@@ -80,7 +79,7 @@ class QueryResponse(BaseQueryResponse):
         for colname in self._data[0].keys():
             if colname != 'url' and colname != 'Time':
                 colnames.append(colname)
-        columns = OrderedDict(((col, [])) for col in colnames)
+        columns = {col: [] for col in colnames}
 
         for qrblock in self:
             for colname in columns.keys():
@@ -208,11 +207,11 @@ class GenericClient(BaseClient):
 
         Returns
         -------
-        rowdict: `~collections.OrderedDict`
-            An Ordered Dictionary which is used by `QueryResponse`
+        rowdict: `dict`
+            A dictionary which is used by `QueryResponse`
             to show results.
         """
-        rowdict = OrderedDict()
+        rowdict = {}
         tr = get_timerange_from_exdict(exdict)
         start = tr.start
         end = tr.end
@@ -2,10 +2,16 @@
 # This module was developed under funding provided by
 # Google Summer of Code 2014
 
+from threading import Lock
 from datetime import datetime
-from collections import OrderedDict
+from itertools import product
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 import astropy.units as u
+from astropy.time import Time
 
 from sunpy import config
 from sunpy.net import attrs as a
@@ -18,6 +24,37 @@ TIME_FORMAT = config.get("general", "time_format")
 __all__ = ["XRSClient", "SUVIClient"]
 
 
+# listings of past searches, keyed by (urlpattern, pattern, start, end)
+_listing_cache = {}
+_listing_cache_lock = Lock()
+_LISTING_CACHE_SIZE = 256
+
+
+def _cached_files_meta(urlpattern, pattern, timerange):
+    """
+    Returns the metadata of the files matching ``urlpattern`` within
+    ``timerange``, remembering non-empty results for repeated searches.
+
+    Only a search for exactly the same range hits the cache, overlapping
+    ranges are fetched again. Empty listings are not cached, as they are also
+    what a missing archive directory gives. The returned dicts are copies, so
+    they can be modified by the caller.
+    """
+    # the Time objects keep their scale, unlike their string forms
+    key = (urlpattern, pattern, timerange.start, timerange.end)
+    with _listing_cache_lock:
+        filesmeta = _listing_cache.get(key)
+    if filesmeta is None:
+        filesmeta = Scraper(urlpattern)._extract_files_meta(timerange, extractor=pattern)
+        if filesmeta:
+            with _listing_cache_lock:
+                if len(_listing_cache) >= _LISTING_CACHE_SIZE:
+                    # dropping the oldest entry
+                    del _listing_cache[next(iter(_listing_cache))]
+                _listing_cache[key] = filesmeta
+    return [dict(meta) for meta in filesmeta]
+
+
 class XRSClient(GenericClient):
     """
     Provides access to the GOES XRS fits files archive.
@@ -52,16 +89,16 @@ class XRSClient(GenericClient):
         return 'goes', 'sunpy.net.dataretriever.attrs.goes'
 
     @classmethod
+    @lru_cache()
     def register_values(cls):
-        from sunpy.net import attrs
         goes_number = [2, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
-        adict = {attrs.Instrument: [
+        adict = {a.Instrument: [
             ("GOES", "The Geostationary Operational Environmental Satellite Program."),
             ("XRS", "GOES X-ray Flux")],
-            attrs.Physobs: [('irradiance', 'the flux of radiant energy per unit area.')],
-            attrs.Source: [('NASA', 'The National Aeronautics and Space Administration.')],
-            attrs.Provider: [('SDAC', 'The Solar Data Analysis Center.')],
-            attrs.goes.SatelliteNumber: [(str(x), f"GOES Satellite Number {x}") for x in goes_number]}
+            a.Physobs: [('irradiance', 'the flux of radiant energy per unit area.')],
+            a.Source: [('NASA', 'The National Aeronautics and Space Administration.')],
+            a.Provider: [('SDAC', 'The Solar Data Analysis Center.')],
+            a.goes.SatelliteNumber: [(str(x), f"GOES Satellite Number {x}") for x in goes_number]}
         return adict
 
 
@@ -115,70 +152,98 @@ class SUVIClient(GenericClient):
     pattern2 = ('{}/goes/goes{SatelliteNumber:2d}/{}/dr_suvi-l{Level}-ci{Wavelength:03d}_g{SatelliteNumber:2d}_s'
                 '{year:4d}{month:2d}{day:2d}T{hour:2d}{minute:2d}{second:2d}Z_e'
                 '{eyear:4d}{emonth:2d}{eday:2d}T{ehour:2d}{eminute:2d}{esecond:2d}Z_{}')
+    max_workers = 8
+    """
+    Maximum number of archive listings to request from NOAA concurrently.
+    """
 
     def post_search_hook(self, i, matchdict):
+        return self._make_row(i, self._constant_columns(matchdict))
 
+    @staticmethod
+    def _constant_columns(matchdict):
+        """
+        Returns the Instrument, Physobs, Source and Provider values, which are
+        the same for every file found by a search.
+        """
+        return (matchdict['Instrument'][0].upper(), matchdict['Physobs'][0],
+                matchdict['Source'][0], matchdict['Provider'][0])
+
+    @staticmethod
+    def _make_row(i, constants):
+        """
+        Builds the response row for one file, with ``constants`` being the
+        values returned by ``_constant_columns``.
+        """
+        instrument, physobs, source, provider = constants
         # extracting start times and end times
         start = datetime(i['year'], i['month'], i['day'], i['hour'], i['minute'], i['second'])
         end = datetime(i['year'], i['month'], i['day'], i['ehour'], i['eminute'], i['esecond'])
-        timerange = TimeRange(start, end)
-
-        rowdict = OrderedDict()
-        rowdict['Time'] = timerange
-        rowdict['Start Time'] = start.strftime(TIME_FORMAT)
-        rowdict['End Time'] = end.strftime(TIME_FORMAT)
-        rowdict['Instrument'] = matchdict['Instrument'][0].upper()
-        rowdict['Physobs'] = matchdict['Physobs'][0]
-        rowdict['Source'] = matchdict['Source'][0]
-        rowdict['Provider'] = matchdict['Provider'][0]
-        rowdict['SatelliteNumber'] = i['SatelliteNumber']
-        rowdict['Level'] = i['Level']
-        rowdict['Wavelength'] = i['Wavelength']*u.Angstrom
-        rowdict['url'] = i['url']
-        return rowdict
+        return {'Time': TimeRange(start, end),
+                'Start Time': start.strftime(TIME_FORMAT),
+                'End Time': end.strftime(TIME_FORMAT),
+                'Instrument': instrument,
+                'Physobs': physobs,
+                'Source': source,
+                'Provider': provider,
+                'SatelliteNumber': i['SatelliteNumber'],
+                'Level': i['Level'],
+                'Wavelength': i['Wavelength']*u.Angstrom,
+                'url': i['url']}
 
     def search(self, *args, **kwargs):
-        supported_waves = [94, 131, 171, 195, 284, 304]*u.Angstrom
-        all_waves = []
+        supported_waves = np.array([94, 131, 171, 195, 284, 304])
         matchdict = self._get_match_dict(*args, **kwargs)
         req_wave = matchdict.get('Wavelength', None)
         if req_wave is not None:
-            wmin = req_wave.min.to(u.Angstrom, equivalencies=u.spectral())
-            wmax = req_wave.max.to(u.Angstrom, equivalencies=u.spectral())
-            req_wave = a.Wavelength(wmin, wmax)
-            for wave in supported_waves:
-                if wave in req_wave:
-                    all_waves.append(int(wave.value))
+            # converting to Angstrom can swap the bounds for spectral units like energy
+            wmin, wmax = sorted(wave.to_value(u.Angstrom, equivalencies=u.spectral())
+                                for wave in (req_wave.min, req_wave.max))
+            in_range = (supported_waves >= wmin) & (supported_waves <= wmax)
+            all_waves = supported_waves[in_range].tolist()
         else:
-            all_waves = [int(i.value) for i in supported_waves]
+            all_waves = supported_waves.tolist()
         all_satnos = matchdict.get('SatelliteNumber')
         all_levels = matchdict.get('Level')
-        metalist = []
 
-        # iterating over all possible Attr values through loops
-        for satno in all_satnos:
-            for level in all_levels:
-                for wave in all_waves:
-                    formdict = {'wave': wave, 'SatelliteNumber': satno}
-                    if str(level) == '1b':
-                        formdict['elem'] = 'fe'
-                        if wave == 304:
-                            formdict['elem'] = 'he'
-                        baseurl = self.baseurl1b
-                        pattern = self.pattern1b
-                    elif str(level) == '2':
-                        baseurl = self.baseurl2
-                        pattern = self.pattern2
-                    else:
-                        raise ValueError(f"Level {level} is not supported.")
-                    # formatting baseurl using Level, SatelliteNumber and Wavelength
-                    urlpattern = baseurl.format(**formdict)
-
-                    scraper = Scraper(urlpattern)
-                    filesmeta = scraper._extract_files_meta(matchdict['Time'], extractor=pattern)
-                    for i in filesmeta:
-                        rowdict = self.post_search_hook(i, matchdict)
-                        metalist.append(rowdict)
+        # building the listing jobs for all possible Attr values up front, so that
+        # unsupported levels are rejected before any network access
+        level_cfg = {'1b': (self.baseurl1b, self.pattern1b),
+                     '2': (self.baseurl2, self.pattern2)}
+        all_levels = [str(level) for level in all_levels]
+        for level in all_levels:
+            if level not in level_cfg:
+                raise ValueError(f"Level {level} is not supported.")
+        # no supported wavelength is in the requested range, so skip any network access
+        if not all_waves:
+            return QueryResponse([], client=self)
+        jobs = []
+        for satno, level, wave in product(all_satnos, all_levels, all_waves):
+            baseurl, pattern = level_cfg[level]
+            formdict = {'wave': wave, 'SatelliteNumber': satno,
+                        'elem': 'he' if wave == 304 else 'fe'}
+            # formatting baseurl using Level, SatelliteNumber and Wavelength
+            jobs.append((baseurl.format(**formdict), pattern))
+
+        timerange = matchdict['Time']
+        # Listings for days that are over will not change, so those can be reused
+        # by later searches. Anything that may still get new files is fetched again.
+        cacheable = timerange.end < Time.now() - 1*u.day
+
+        def _fetch_one(job):
+            urlpattern, pattern = job
+            if cacheable:
+                return _cached_files_meta(urlpattern, pattern, timerange)
+            scraper = Scraper(urlpattern)
+            return scraper._extract_files_meta(timerange, extractor=pattern)
+
+        # Each listing is an independent HTTP request, so run them concurrently.
+        # ``map`` keeps the results in the same order as ``jobs``.
+        constants = self._constant_columns(matchdict)
+        metalist = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for filesmeta in executor.map(_fetch_one, jobs):
+                metalist.extend(self._make_row(i, constants) for i in filesmeta)
 
         return QueryResponse(metalist, client=self)
 
@@ -187,16 +252,16 @@ class SUVIClient(GenericClient):
         return 'goes', 'sunpy.net.dataretriever.attrs.goes'
 
     @classmethod
+    @lru_cache()
     def register_values(cls):
-        from sunpy.net import attrs
         goes_number = [16, 17]
-        adict = {attrs.Instrument: [
+        adict = {a.Instrument: [
             ("SUVI", "GOES Solar Ultraviolet Imager.")],
-            attrs.goes.SatelliteNumber: [(str(x), f"GOES Satellite Number {x}") for x in goes_number],
-            attrs.Source: [('GOES', 'The Geostationary Operational Environmental Satellite Program.')],
-            attrs.Physobs: [('flux', 'a measure of the amount of radiation received by an object from a given source.')],
-            attrs.Provider: [('NOAA', 'The National Oceanic and Atmospheric Administration.')],
-            attrs.Level: [('1b', 'Solar images at six wavelengths with image exposures 10 msec or 1 sec.'),
-                          ('2', 'Weighted average of level-1b product files of SUVI.')],
-            attrs.Wavelength: [('*')]}
+            a.goes.SatelliteNumber: [(str(x), f"GOES Satellite Number {x}") for x in goes_number],
+            a.Source: [('GOES', 'The Geostationary Operational Environmental Satellite Program.')],
+            a.Physobs: [('flux', 'a measure of the amount of radiation received by an object from a given source.')],
+            a.Provider: [('NOAA', 'The National Oceanic and Atmospheric Administration.')],
+            a.Level: [('1b', 'Solar images at six wavelengths with image exposures 10 msec or 1 sec.'),
+                      ('2', 'Weighted average of level-1b product files of SUVI.')],
+            a.Wavelength: [('*')]}
         return adict
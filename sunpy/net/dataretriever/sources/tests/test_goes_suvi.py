@@ -1,9 +1,13 @@
+import re
 import tempfile
+from itertools import product
+from unittest.mock import patch
 
 import pytest
 from hypothesis import given
 
 import astropy.units as u
+from astropy.time import Time
 
 import sunpy.net.dataretriever.sources.goes as goes
 from sunpy.net import Fido
@@ -18,6 +22,13 @@ def suvi_client():
     return goes.SUVIClient()
 
 
+@pytest.fixture
+def clear_listing_cache():
+    goes._listing_cache.clear()
+    yield
+    goes._listing_cache.clear()
+
+
 @given(time_attr())
 def test_can_handle_query(time):
     # Don't use the fixture, as hypothesis complains
@@ -210,3 +221,84 @@ def test_show(suvi_client):
     assert qrshow0.colnames == allcols
     assert qrshow1.colnames == ['Start Time', 'Instrument']
     assert qrshow0['Instrument'][0] == 'SUVI'
+
+
+def mock_files_meta(scraper, timerange, extractor=None, matcher=None):
+    """
+    Stands in for ``Scraper._extract_files_meta``, returning one file per listing
+    with the satellite, level and wavelength taken from the listing's url pattern.
+    """
+    satno, level, wave = re.search(r'goes(\d+)/l(1b|2)/.*?(\d{3})/', scraper.pattern).groups()
+    return [{'year': 2019, 'month': 5, 'day': 25, 'hour': 0, 'minute': 52, 'second': 0,
+             'ehour': 0, 'eminute': 56, 'esecond': 0, 'SatelliteNumber': int(satno),
+             'Level': level, 'Wavelength': int(wave), 'url': scraper.pattern}]
+
+
+def test_search_rows_follow_job_order(suvi_client, clear_listing_cache):
+    with patch.object(goes.Scraper, '_extract_files_meta', autospec=True,
+                      side_effect=mock_files_meta):
+        qr = suvi_client.search(a.Time('2019/05/25 00:50', '2019/05/25 00:54'), a.Instrument.suvi,
+                                a.Wavelength(90 * u.Angstrom, 135 * u.Angstrom))
+    baseurls = {'1b': suvi_client.baseurl1b, '2': suvi_client.baseurl2}
+    expected = list(product(['16', '17'], ['1b', '2'], [94, 131]))
+    assert len(qr) == len(expected) == 8
+    for row, (satno, level, wave) in zip(qr, expected):
+        assert row['url'] == baseurls[level].format(wave=wave, SatelliteNumber=satno, elem='fe')
+        assert row['Instrument'] == 'SUVI'
+        assert row['Physobs'] == 'flux'
+        assert row['Source'] == 'GOES'
+        assert row['Provider'] == 'NOAA'
+        assert row['SatelliteNumber'] == int(satno)
+        assert row['Level'] == level
+        assert row['Start Time'] == '2019-05-25 00:52:00'
+        assert row['End Time'] == '2019-05-25 00:56:00'
+        assert row['Time'] == TimeRange('2019-05-25 00:52', '2019-05-25 00:56')
+        assert row['Wavelength'].unit == u.Angstrom
+        assert row['Wavelength'] == wave * u.Angstrom
+
+
+def test_search_reuses_past_listings(suvi_client, clear_listing_cache):
+    query = (a.Time('2019/05/25 00:50', '2019/05/25 00:52'), a.Instrument.suvi,
+             a.goes.SatelliteNumber(16), a.Level(2), a.Wavelength(94 * u.Angstrom))
+    with patch.object(goes.Scraper, '_extract_files_meta', autospec=True,
+                      side_effect=mock_files_meta) as extract_mock:
+        qr1 = suvi_client.search(*query)
+        qr2 = suvi_client.search(*query)
+    assert extract_mock.call_count == 1
+    assert len(qr1) == len(qr2) == 1
+    assert qr1.blocks[0]['url'] == qr2.blocks[0]['url']
+
+
+def test_search_does_not_cache_empty_listings(suvi_client, clear_listing_cache):
+    query = (a.Time('2019/05/25 00:50', '2019/05/25 00:52'), a.Instrument.suvi,
+             a.goes.SatelliteNumber(16), a.Level(2), a.Wavelength(94 * u.Angstrom))
+    with patch.object(goes.Scraper, '_extract_files_meta', return_value=[]) as extract_mock:
+        suvi_client.search(*query)
+        suvi_client.search(*query)
+    assert extract_mock.call_count == 2
+
+
+def test_search_refetches_recent_listings(suvi_client, clear_listing_cache):
+    now = Time.now()
+    query = (a.Time(now - 1 * u.hour, now), a.Instrument.suvi,
+             a.goes.SatelliteNumber(16), a.Level(2), a.Wavelength(94 * u.Angstrom))
+    with patch.object(goes.Scraper, '_extract_files_meta', autospec=True,
+                      side_effect=mock_files_meta) as extract_mock:
+        suvi_client.search(*query)
+        suvi_client.search(*query)
+    assert extract_mock.call_count == 2
+
+
+def test_search_no_supported_wavelength(suvi_client):
+    with patch.object(goes, 'ThreadPoolExecutor') as executor_mock:
+        qr = suvi_client.search(a.Time('2019/05/25 00:50', '2019/05/25 00:52'), a.Instrument.suvi,
+                                a.Wavelength(1 * u.Angstrom, 50 * u.Angstrom))
+    assert isinstance(qr, QueryResponse)
+    assert len(qr) == 0
+    executor_mock.assert_not_called()
+
+
+def test_search_unsupported_level_no_supported_wavelength(suvi_client):
+    with pytest.raises(ValueError, match="Level 3 is not supported."):
+        suvi_client.search(a.Time('2019/05/25 00:50', '2019/05/25 00:52'), a.Instrument.suvi,
+                           a.Level('3'), a.Wavelength(1 * u.Angstrom, 50 * u.Angstrom))
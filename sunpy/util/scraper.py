@@ -7,6 +7,7 @@ import calendar
 import datetime
 import warnings
 from ftplib import FTP
+from functools import lru_cache
 from urllib.error import HTTPError
 from urllib.parse import urlsplit
 from urllib.request import urlopen
@@ -16,7 +17,7 @@ from bs4 import BeautifulSoup
 import astropy.units as u
 from astropy.time import Time, TimeDelta
 
-from sunpy.extern.parse import parse
+from sunpy.extern.parse import compile as compile_parser
 from sunpy.time import TimeRange
 from sunpy.util.exceptions import SunpyUserWarning
 
@@ -32,6 +33,30 @@ TIME_CONVERSIONS = {'%Y': r'\d{4}', '%y': r'\d{2}',
                     '%S': r'\d{2}', '%e': r'\d{3}', '%f': r'\d{6}'}
 
 
+@lru_cache(maxsize=64)
+def _compiled_pattern(pattern):
+    """
+    Returns ``pattern`` compiled as a regex, with the datetime formats
+    replaced by their regular expressions.
+
+    This is cached as it is called for every URL found in the archive.
+    """
+    for k, v in TIME_CONVERSIONS.items():
+        pattern = pattern.replace(k, v)
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=64)
+def _compiled_extractor(extractor):
+    """
+    Returns a parser for the ``extractor`` pattern.
+
+    This is cached so the pattern is only translated to a regex once,
+    instead of for every URL that is parsed with it.
+    """
+    return compile_parser(extractor)
+
+
 class Scraper:
     """
     A Scraper to scrap web data archives based on dates.
@@ -131,10 +156,7 @@ class Scraper:
         """
         Check whether the url provided follows the pattern.
         """
-        pattern = self.pattern
-        for k, v in TIME_CONVERSIONS.items():
-            pattern = pattern.replace(k, v)
-        matches = re.match(pattern, url)
+        matches = _compiled_pattern(self.pattern).match(url)
         if matches:
             return matches.end() == matches.endpos
         return False
@@ -326,7 +348,7 @@ class Scraper:
             `True` if URL's time overlaps the given timerange, else `False`.
         """
         if hasattr(self, 'extractor'):
-            exdict = parse(self.extractor, url).named
+            exdict = _compiled_extractor(self.extractor).parse(url).named
             tr = get_timerange_from_exdict(exdict)
             return (tr.end >= timerange.start and tr.start <= timerange.end)
         else:
@@ -375,9 +397,10 @@ class Scraper:
         """
         self.extractor = extractor
         urls = self.filelist(timerange)
+        parser = _compiled_extractor(extractor)
         metalist = []
         for url in urls:
-            metadict = parse(extractor, url)
+            metadict = parser.parse(url)
             if metadict is not None:
                 append = True
                 metadict = metadict.named
@@ -8,7 +8,7 @@ from astropy.time import TimeDelta
 
 from sunpy.data.test import rootdir
 from sunpy.time import TimeRange, parse_time
-from sunpy.util.scraper import Scraper, get_timerange_from_exdict
+from sunpy.util.scraper import Scraper, _compiled_pattern, get_timerange_from_exdict
 
 PATTERN_EXAMPLES = [
     ('%b%y', TimeDelta(31*u.day)),
@@ -143,6 +143,13 @@ def testURL_pattern():
     assert not s._URL_followsPattern('fd_20130410_ar_231211.fts.gz')
 
 
+def testURL_pattern_compiled_once():
+    s = Scraper('fd_%Y%m%d_%H%M%S.fts')
+    assert s._URL_followsPattern('fd_20130410_231211.fts')
+    assert _compiled_pattern(s.pattern) is _compiled_pattern('fd_%Y%m%d_%H%M%S.fts')
+    assert _compiled_pattern(s.pattern).pattern == r'fd_\d{4}\d{2}\d{2}_\d{2}\d{2}\d{2}.fts'
+
+
 def testURL_patternMillisecondsGeneric():
     s = Scraper('fd_%Y%m%d_%H%M%S_%e.fts')
     assert s._URL_followsPattern('fd_20130410_231211_119.fts')
@@ -275,6 +282,25 @@ def test_extract_files_meta():
     assert metalist1[-1]['url'] == urls[-1]
 
 
+def test_extract_files_meta_local():
+    s = Scraper('/'.join(['file:/', rootdir, 'EIT', 'efz%Y%m%d.%H%M%S_s.fits']))
+    extractpattern = '{}/EIT/efz{year:4d}{month:2d}{day:2d}.{hour:2d}{minute:2d}{second:2d}_s.fits'
+    timerange = TimeRange('2004-03-01 04:00', '2004-03-01 06:30')
+    metalist = s._extract_files_meta(timerange, extractpattern)
+    assert sorted(meta['hour'] for meta in metalist) == [4, 5, 6]
+    meta = next(meta for meta in metalist if meta['hour'] == 5)
+    assert meta['year'] == 2004
+    assert meta['month'] == 3
+    assert meta['day'] == 1
+    assert meta['minute'] == 0
+    assert meta['second'] == 10
+    assert meta['url'].endswith('EIT/efz20040301.050010_s.fits')
+    # the files at 04:00:10 and 06:00:10 fall outside the range parsed from their names
+    timerange = TimeRange('2004-03-01 04:00:11', '2004-03-01 06:00:09')
+    metalist = s._extract_files_meta(timerange, extractpattern)
+    assert [meta['hour'] for meta in metalist] == [5]
+
+
 @pytest.mark.parametrize('exdict, start, end', [
     ({"year": 2000}, '2000-01-01 00:00:00', '2000-12-31 23:59:59.999000'),
     ({"year": 2016, "month": 2}, '2016-02-01 00:00:00', '2016-02-29 23:59:59.999000'),